@@ -0,0 +1,145 @@
+# compare req/s and latency of the sync routes, the async routes and serve.py
+#
+#   python benchmarks/bench_server.py --baseline-ref <sync-commit>
+#   python benchmarks/bench_server.py --baseline-ref <sync-commit> --path /users/alice/followers -c 128 -n 20000
+#   python benchmarks/bench_server.py --baseline-ref <sync-commit> --multi-workers 8
+#
+# <sync-commit> is any git ref whose routes are still sync `def`s, e.g. the
+# commit before the routes were made async.
+#
+# Profiles, so each row changes one thing at a time:
+#   sync   - the --baseline-ref code (checked out into a temporary git worktree)
+#            under plain `uvicorn main:app`, 1 worker
+#   async  - this tree under plain `uvicorn main:app`, 1 worker
+#   prod   - this tree under serve.py with WEB_CONCURRENCY workers
+#   prod-N - serve.py with N workers (only with --multi-workers N)
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from services.config import WEB_CONCURRENCY
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def wait_until_ready(base_url, timeout=20):
+    deadline = time.perf_counter() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.perf_counter() < deadline:
+            try:
+                await client.get(base_url + "/")
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.2)
+    raise RuntimeError(f"server at {base_url} did not start")
+
+
+async def run_load(url, concurrency, total):
+    latencies = []
+    errors = 0
+    remaining = total
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+        async def worker():
+            nonlocal remaining, errors
+            while remaining > 0:
+                remaining -= 1
+                started = time.perf_counter()
+                try:
+                    response = await client.get(url)
+                    if response.status_code >= 500:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "errors": errors,
+    }
+
+
+def bench_profile(name, command, cwd, port, args):
+    base_url = f"http://127.0.0.1:{port}"
+    server = subprocess.Popen(command, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        asyncio.run(wait_until_ready(base_url))
+        # warm up connections and imports before measuring
+        asyncio.run(run_load(base_url + args.path, args.concurrency, args.concurrency * 10))
+        result = asyncio.run(run_load(base_url + args.path, args.concurrency, args.requests))
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+    print(
+        f"{name:<8} {result['rps']:>10.0f} {result['p50_ms']:>10.2f} "
+        f"{result['p99_ms']:>10.2f} {result['errors']:>8}"
+    )
+    return result
+
+
+def git(*args):
+    return subprocess.run(["git", *args], cwd=ROOT, check=True,
+                          capture_output=True, text=True).stdout.strip()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the sync, async and production server profiles")
+    parser.add_argument("--path", default="/")
+    parser.add_argument("-c", "--concurrency", type=int, default=64)
+    parser.add_argument("-n", "--requests", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=WEB_CONCURRENCY,
+                        help="workers for the prod profile (default: WEB_CONCURRENCY)")
+    parser.add_argument("--multi-workers", type=int, default=None,
+                        help="also run serve.py with this many workers")
+    parser.add_argument("--baseline-ref", required=True,
+                        help="git ref of the sync code to compare against")
+    parser.add_argument("--port", type=int, default=8100)
+    args = parser.parse_args()
+
+    def uvicorn_cmd(port):
+        return [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port),
+                "--loop", "asyncio", "--http", "h11", "--no-access-log"]
+
+    def serve_cmd(port, workers):
+        return [sys.executable, "serve.py", "--host", "127.0.0.1",
+                "--port", str(port), "--workers", str(workers)]
+
+    baseline_ref = args.baseline_ref
+    baseline_dir = tempfile.mkdtemp(prefix="feed-sync-")
+    git("worktree", "add", "--detach", baseline_dir, baseline_ref)
+    try:
+        print(f"GET {args.path}  concurrency={args.concurrency}  requests={args.requests}")
+        print(f"sync baseline: {git('rev-parse', '--short', baseline_ref)}")
+        print(f"{'':<8} {'req/s':>10} {'p50 ms':>10} {'p99 ms':>10} {'errors':>8}")
+        bench_profile("sync", uvicorn_cmd(args.port), baseline_dir, args.port, args)
+        bench_profile("async", uvicorn_cmd(args.port + 1), ROOT, args.port + 1, args)
+        bench_profile("prod", serve_cmd(args.port + 2, args.workers), ROOT, args.port + 2, args)
+        if args.multi_workers:
+            bench_profile(f"prod-{args.multi_workers}", serve_cmd(args.port + 3, args.multi_workers),
+                          ROOT, args.port + 3, args)
+    finally:
+        git("worktree", "remove", "--force", baseline_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,30 @@
 #entry point for FastAPI
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from routers.auth_routers import router as auth_router
-from routers.users_routers import router as users_router
+from routers.users_routers import router as users_router, start_file_executor, stop_file_executor
 from routers.posts_routers import router as posts_router
 from routers.feed_routers import router as feed_router
 from routers.likes_routers import router as likes_router
 from routers.comments_routers import router as comments_router
+from services.auth_services import start_hash_executor, stop_hash_executor
+from services.config import USERS_SNAPSHOT_FILE
+from services.users_services import load_snapshot
+import os
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # seed the in-memory store from the last `manage_users.py import`
+    if os.path.exists(USERS_SNAPSHOT_FILE):
+        load_snapshot(USERS_SNAPSHOT_FILE)
+    start_hash_executor()
+    start_file_executor()
+    yield
+    # let in-flight hashing and uploads finish before the worker exits
+    await stop_hash_executor()
+    await stop_file_executor()
+
+app = FastAPI(lifespan=lifespan)
 
 app.include_router(auth_router, prefix="/auth", tags=["Auth"])
 app.include_router(users_router, prefix="/users", tags=["Users"])
@@ -17,5 +34,5 @@ app.include_router(likes_router, tags=["Likes"])
 app.include_router(comments_router, tags=["Comments"])
 
 @app.get("/")
-def root():
+async def root():
     return{"message": "A mini social feed API working perfectly!"}
\ No newline at end of file
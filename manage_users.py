@@ -0,0 +1,58 @@
+# command-line tool for bulk user import/export
+#   python manage_users.py import users.csv --workers 8
+#   python manage_users.py export --out users.jsonl
+import argparse
+import os
+import sys
+from services.config import USERS_SNAPSHOT_FILE, IMPORT_BATCH_SIZE
+from services.users_services import read_user_rows, import_users, export_users, load_snapshot, save_snapshot
+
+
+def run_import(args):
+    if os.path.exists(args.snapshot):
+        load_snapshot(args.snapshot)
+    try:
+        report = import_users(
+            read_user_rows(args.source),
+            batch_size=args.batch_size,
+            workers=args.workers
+        )
+    finally:
+        # keep every batch already written to the store, even if the run dies
+        save_snapshot(args.snapshot)
+    print(f"Imported {report['imported']} users, skipped {report['skipped']}", file=sys.stderr)
+
+
+def run_export(args):
+    if os.path.exists(args.snapshot):
+        load_snapshot(args.snapshot)
+    if args.out == "-":
+        export_users(sys.stdout)
+    else:
+        with open(args.out, "w", encoding="utf-8") as f:
+            export_users(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk user import/export")
+    parser.add_argument("--snapshot", default=USERS_SNAPSHOT_FILE,
+                        help="user store snapshot loaded by the API at startup")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = sub.add_parser("import", help="import users from a .jsonl or .csv file")
+    import_parser.add_argument("source")
+    import_parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+    import_parser.add_argument("--workers", type=int, default=None,
+                               help="hashing processes (default: all cores)")
+    import_parser.set_defaults(func=run_import)
+
+    export_parser = sub.add_parser("export", help="export users and follows as JSONL")
+    export_parser.add_argument("--out", default="-")
+    export_parser.set_defaults(func=run_export)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
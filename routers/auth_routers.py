@@ -1,10 +1,10 @@
 # authentication logic
 from fastapi import APIRouter, HTTPException, Depends, Body
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from pwdlib import PasswordHash
 from jose import jwt, JWTError
 from datetime import datetime, timedelta, timezone
 from schemas.auth_schema import UserCreate, UserPublic, UserInDB, LoginRequest, TokenRefreshRequest, PasswordResetRequest, PasswordResetConfirm
+from services.auth_services import hash_password_async, verify_password_async
 from services.config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES, REFRESH_TOKEN_EXPIRE_DAYS
 from databases.database import users_db, refresh_tokens_db
 import uuid
@@ -12,23 +12,11 @@ import uuid
 
 router = APIRouter()
 
-# password hashing
-# pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-password_hash = PasswordHash.recommended()
-
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
 # HELPER FUNCTIONS
-def hash_password(password: str) -> str:
-    return password_hash.hash(password)
-
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return password_hash.verify(plain_password, hashed_password)
-
-
 def create_access_token(data: dict, expires_delta: timedelta):
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + expires_delta
@@ -84,7 +72,7 @@ def create_password_reset_token(user_id: str):
 
 
 # --- Dependency ---
-def get_current_user_dep(token: str = Depends(oauth2_scheme)):
+async def get_current_user_dep(token: str = Depends(oauth2_scheme)):
     payload = verify_token(token)
     user_id: str = payload.get("sub")
     # Check if refresh token is revoked
@@ -101,7 +89,7 @@ def get_current_user_dep(token: str = Depends(oauth2_scheme)):
     raise HTTPException(status_code=404, detail="User not found")
 
 
-def get_current_active_user_dep(current_user: UserInDB = Depends(get_current_user_dep)):
+async def get_current_active_user_dep(current_user: UserInDB = Depends(get_current_user_dep)):
     if not current_user.status:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
@@ -110,8 +98,7 @@ def get_current_active_user_dep(current_user: UserInDB = Depends(get_current_use
 # ENDPOINTS
 
 
-@router.post("/register", response_model=UserPublic, status_code=201)
-def register(user_data: UserCreate):
+def check_user_available(user_data: UserCreate):
     if user_data.username in users_db:
         raise HTTPException(
             status_code=409, detail="Username already registered")
@@ -120,8 +107,15 @@ def register(user_data: UserCreate):
         if u.email == user_data.email:
             raise HTTPException(status_code=409, detail="Email already exists")
 
+
+@router.post("/register", response_model=UserPublic, status_code=201)
+async def register(user_data: UserCreate):
+    check_user_available(user_data)
+
     user_id = str(uuid.uuid4())
-    hashed_pw = hash_password(user_data.password)
+    hashed_pw = await hash_password_async(user_data.password)
+    # another request may have taken the name/email while we were hashing
+    check_user_available(user_data)
 
     new_user = UserInDB(
         id=user_id,
@@ -143,7 +137,7 @@ def register(user_data: UserCreate):
     return UserPublic(**new_user.dict())
 
 @router.get("/verify-email")
-def verify_email(token: str):
+async def verify_email(token: str):
     payload = verify_token(token)
 
     if payload.get("type") != "email_verify":
@@ -161,14 +155,14 @@ def verify_email(token: str):
     raise HTTPException(status_code=404, detail="User not found")
 
 @router.post("/login")
-def login(request: OAuth2PasswordRequestForm = Depends()):
+async def login(request: OAuth2PasswordRequestForm = Depends()):
     # Find user by username or email
     user = None
     for u in users_db.values():
         if u.username == request.username or u.email == request.username:
             user = u
             break
-    if not user or not verify_password(request.password, user.hashed_password):
+    if not user or not await verify_password_async(request.password, user.hashed_password):
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
     if not user.is_email_verified:
@@ -192,12 +186,12 @@ def login(request: OAuth2PasswordRequestForm = Depends()):
 
 
 @router.get("/me", response_model=UserPublic)
-def read_current_user(current_user: dict = Depends(get_current_user_dep)):
+async def read_current_user(current_user: dict = Depends(get_current_user_dep)):
     return current_user
 
 
 @router.post("/logout")
-def logout(token: str = Depends(oauth2_scheme)):
+async def logout(token: str = Depends(oauth2_scheme)):
     payload = verify_token(token)
     user_id = payload.get("sub")
     if user_id in refresh_tokens_db:
@@ -208,7 +202,7 @@ def logout(token: str = Depends(oauth2_scheme)):
 
 
 @router.post("/refresh")
-def refresh_access_token(request: TokenRefreshRequest):
+async def refresh_access_token(request: TokenRefreshRequest):
     # Verify  the incoming refresh token
     payload = verify_token(request.refresh_token)
     token_type = payload.get("type")
@@ -267,7 +261,7 @@ def refresh_access_token(request: TokenRefreshRequest):
 
 
 @router.post("/password-reset/request")
-def request_password_reset(data: PasswordResetRequest):
+async def request_password_reset(data: PasswordResetRequest):
     user = None
     for u in users_db.values():
         if u.email == data.email:
@@ -286,7 +280,7 @@ def request_password_reset(data: PasswordResetRequest):
 
 
 @router.post("/password-reset/confirm")
-def confirm_password_reset(data: PasswordResetConfirm):
+async def confirm_password_reset(data: PasswordResetConfirm):
     payload = verify_token(data.token)
 
     if payload.get("type") != "password_reset":
@@ -296,7 +290,7 @@ def confirm_password_reset(data: PasswordResetConfirm):
 
     for user in users_db.values():
         if str(user.id) == user_id:
-            user.hashed_password = hash_password(data.new_password)
+            user.hashed_password = await hash_password_async(data.new_password)
             return {"message": "Password reset successful"}
 
     raise HTTPException(status_code=404, detail="User not found")
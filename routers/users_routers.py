@@ -6,7 +6,10 @@ from schemas.auth_schema import *
 from routers.auth_routers import get_current_user_dep
 from datetime import datetime, timezone
 from databases.database import users_db
-from services.config import UPLOAD_DIR  
+from services.config import UPLOAD_DIR, FILE_WORKERS
+from services.users_services import UserLoader, get_user_loader
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import os
 import shutil
 
@@ -14,6 +17,9 @@ router = APIRouter()
 
 AVATAR_UPLOAD_DIR = os.path.join(UPLOAD_DIR, "avatars")
 os.makedirs(AVATAR_UPLOAD_DIR, exist_ok=True)
+# disk writes run here so they never block the event loop; created and
+# drained by the app lifespan (see main.py)
+file_executor: Optional[ThreadPoolExecutor] = None
 
 # -----------------------#
 # Helper utilities       #
@@ -24,12 +30,6 @@ def get_user_by_username(username: str) -> UserInDB:
         raise HTTPException(status_code=404, detail="User not found")
     return user
 
-def get_user_by_id(user_id: str) -> Optional[UserInDB]:
-    for user in users_db.values():
-        if str(user.id) == user_id:
-            return user
-    raise HTTPException(status_code=404, detail="User not found")
-
 def build_public_profile(user: UserInDB) -> UserProfilePublic:
     user_data = user.model_dump()
     # Calculate counts manually since they aren't stored as ints in UserInDB
@@ -37,6 +37,20 @@ def build_public_profile(user: UserInDB) -> UserProfilePublic:
     user_data["following_count"] = len(user.following)
     return UserProfilePublic(**user_data)
 
+def save_upload(upload: UploadFile, file_path: str):
+    with open(file_path, "wb") as buffer:
+        shutil.copyfileobj(upload.file, buffer)
+
+def start_file_executor():
+    global file_executor
+    file_executor = ThreadPoolExecutor(max_workers=FILE_WORKERS, thread_name_prefix="files")
+
+async def stop_file_executor():
+    global file_executor
+    executor, file_executor = file_executor, None
+    if executor:
+        await asyncio.to_thread(executor.shutdown, wait=True)
+
 def build_follower_summary(user: UserInDB) -> FollowerSummary:
     return FollowerSummary(
         id=user.id,
@@ -48,12 +62,12 @@ def build_follower_summary(user: UserInDB) -> FollowerSummary:
 # ENDPOINTS              #
 # -----------------------#
 @router.get("/{username}", response_model=UserProfilePublic)
-def get_user_profile(username: str):
+async def get_user_profile(username: str):
     one_user = get_user_by_username(username)
     return build_public_profile(one_user)
 
 @router.patch("/me", response_model=UserProfilePublic)
-def update_my_profile(
+async def update_my_profile(
     display_name: Optional[str] = Form(None),
     bio: Optional[str] = Form(None),
     avatar: Optional[UploadFile] = File(None),
@@ -72,8 +86,8 @@ def update_my_profile(
         file_name = f"{user.id}{file_extension}"
         file_path = os.path.join(AVATAR_UPLOAD_DIR, file_name)
         # Save the file to local storage
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(avatar.file, buffer)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(file_executor, save_upload, avatar, file_path)
         # Store the path in the user object
         user.avatar_url = f"/{file_path}"
     # 4. Update the 'updated_at' timestamp
@@ -81,7 +95,7 @@ def update_my_profile(
     return build_public_profile(user)
 
 @router.post("/{username}/follow", status_code=204)
-def follow_user(username_to_follow: str, current_user: UserInDB = Depends(get_current_user_dep)):
+async def follow_user(username_to_follow: str, current_user: UserInDB = Depends(get_current_user_dep)):
     #Find the person to follow
     target_user = get_user_by_username(username_to_follow)
     if current_user.id == target_user.id:
@@ -99,7 +113,7 @@ def follow_user(username_to_follow: str, current_user: UserInDB = Depends(get_cu
     }
 
 @router.delete("/{username}/follow", status_code=200)
-def unfollow_user(username_to_unfollow: str, current_user: UserInDB = Depends(get_current_user_dep)):
+async def unfollow_user(username_to_unfollow: str, current_user: UserInDB = Depends(get_current_user_dep)):
     target_user = get_user_by_username(username_to_unfollow)
     if target_user.id not in current_user.following:
         raise HTTPException(
@@ -118,17 +132,14 @@ def unfollow_user(username_to_unfollow: str, current_user: UserInDB = Depends(ge
     }
 
 @router.get("/{username}/followers", response_model=FollowersResponse)
-def get_user_followers(username: str):
+async def get_user_followers(username: str, loader: UserLoader = Depends(get_user_loader)):
     #want to see the followers of the authenticated user
     target_user = get_user_by_username(username) 
-    # 2. Convert their set of follower IDs into real user objects
-    follower_list = []
-    for follower_id in target_user.followers:
-        # Look up the user by their UUID
-        user_obj = get_user_by_id(str(follower_id))
-        if user_obj:
-            summary = build_follower_summary(user_obj)
-            follower_list.append(summary)     
+    # 2. Convert their set of follower IDs into real user objects in one batch
+    follower_list = [
+        build_follower_summary(user_obj)
+        for user_obj in loader.get_many(target_user.followers)
+    ]
     # 3. Return the response matching your FollowersResponse schema
     return FollowersResponse(
         username=target_user.username,
@@ -136,14 +147,14 @@ def get_user_followers(username: str):
     )
 
 @router.get("/{username}/following", response_model=FollowingResponse)
-def get_user_following(username: str):
+async def get_user_following(username: str, loader: UserLoader = Depends(get_user_loader)):
     # 1. Find the user
     target_user = get_user_by_username(username)
-    following_list = []
-    for following_id in target_user.following:
-        user_obj = get_user_by_id(str(following_id))
-        if user_obj:
-            following_list.append(build_follower_summary(user_obj))   
+    # 2. Resolve every followed id with a single store lookup
+    following_list = [
+        build_follower_summary(user_obj)
+        for user_obj in loader.get_many(target_user.following)
+    ]
     # 3. Return the response
     return FollowingResponse(
         username=target_user.username,
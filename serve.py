@@ -0,0 +1,40 @@
+# production launcher: python serve.py
+# (use `uvicorn main:app --reload` for development)
+import argparse
+import importlib.util
+import uvicorn
+from services.config import HOST, PORT, WEB_CONCURRENCY, KEEP_ALIVE_TIMEOUT, BACKLOG, GRACEFUL_SHUTDOWN_TIMEOUT
+
+# uvloop is not available on Windows, fall back to the default loop there;
+# likewise fall back to the pure-Python h11 parser without httptools
+LOOP = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+HTTP = "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the API with the production server profile")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--workers", type=int, default=WEB_CONCURRENCY)
+    args = parser.parse_args()
+
+    uvicorn.run(
+        "main:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        loop=LOOP,
+        http=HTTP,
+        # longer than a typical load balancer idle timeout (60s) so the
+        # proxy, not us, closes idle connections
+        timeout_keep_alive=KEEP_ALIVE_TIMEOUT,
+        backlog=BACKLOG,
+        # on SIGTERM stop accepting, then give in-flight requests time to drain
+        timeout_graceful_shutdown=GRACEFUL_SHUTDOWN_TIMEOUT,
+        proxy_headers=True,
+        access_log=False,
+    )
+
+
+if __name__ == "__main__":
+    main()
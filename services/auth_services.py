@@ -0,0 +1,62 @@
+# password hashing helpers shared by the auth router and the bulk user tools
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
+from pwdlib.hashers.bcrypt import BcryptHasher
+from services.config import HASH_WORKERS
+
+# argon2 for new hashes, bcrypt kept so imported bcrypt hashes still verify
+password_hash = PasswordHash((Argon2Hasher(), BcryptHasher()))
+
+HASH_PREFIXES = ("$argon2", "$2a$", "$2b$", "$2y$")
+
+# argon2/bcrypt release the GIL, so a thread pool hashes in parallel
+# without blocking the event loop. It is created and drained by the app
+# lifespan (see main.py); outside of it the loop's default executor is used.
+hash_executor: Optional[ThreadPoolExecutor] = None
+
+
+def hash_password(password: str) -> str:
+    return password_hash.hash(password)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return password_hash.verify(plain_password, hashed_password)
+
+
+def is_password_hash(value) -> bool:
+    # True only for well-formed argon2/bcrypt hashes we can store as they are
+    if not isinstance(value, str) or not value.startswith(HASH_PREFIXES):
+        return False
+    if not any(hasher.identify(value) for hasher in password_hash.hashers):
+        return False
+    if value.startswith("$2"):
+        # bcrypt refuses cost factors outside 4-31 at verify time
+        return 4 <= int(value[4:6]) <= 31
+    return True
+
+
+async def hash_password_async(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(hash_executor, hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(hash_executor, verify_password, plain_password, hashed_password)
+
+
+def start_hash_executor():
+    global hash_executor
+    hash_executor = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="hash")
+
+
+async def stop_hash_executor():
+    # detach first so new work goes to the default executor, then let
+    # in-flight hashes finish off the event loop
+    global hash_executor
+    executor, hash_executor = hash_executor, None
+    if executor:
+        await asyncio.to_thread(executor.shutdown, wait=True)
@@ -8,4 +8,21 @@ SECRET_KEY = os.getenv("JWT_SECRET", "supersecret")
 ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
 REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", 7))
-UPLOAD_DIR = os.getenv("UPLOAD_DIR", "uploads")
\ No newline at end of file
+UPLOAD_DIR = os.getenv("UPLOAD_DIR", "uploads")
+
+# Bulk user tools
+USERS_SNAPSHOT_FILE = os.getenv("USERS_SNAPSHOT_FILE", "users_snapshot.jsonl")
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", 500))
+
+# Executors for blocking work on the async request path
+HASH_WORKERS = int(os.getenv("HASH_WORKERS", os.cpu_count() or 1))
+FILE_WORKERS = int(os.getenv("FILE_WORKERS", 4))
+
+# Production server (serve.py)
+HOST = os.getenv("HOST", "0.0.0.0")
+PORT = int(os.getenv("PORT", 8000))
+# users_db is in-memory and per-process: keep 1 worker until a shared database exists
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", 1))
+KEEP_ALIVE_TIMEOUT = int(os.getenv("KEEP_ALIVE_TIMEOUT", 75))
+BACKLOG = int(os.getenv("BACKLOG", 2048))
+GRACEFUL_SHUTDOWN_TIMEOUT = int(os.getenv("GRACEFUL_SHUTDOWN_TIMEOUT", 30))
@@ -0,0 +1,319 @@
+# users_db helpers: bulk import/export and batched user lookups
+import csv
+import json
+import os
+import sys
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+from pydantic import ValidationError
+from schemas.auth_schema import UserBase, UserInDB
+from services.auth_services import hash_password, is_password_hash
+from databases.database import users_db
+
+
+class Progress:
+    """Prints a rows/s line to stderr every `every` rows."""
+
+    def __init__(self, label: str, every: int = 1000, out: TextIO = sys.stderr):
+        self.label = label
+        self.every = every
+        self.out = out
+        self.count = 0
+        self.started = time.perf_counter()
+
+    def tick(self, n: int = 1):
+        before = self.count
+        self.count += n
+        if self.count // self.every != before // self.every:
+            self.report()
+
+    def report(self):
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        print(
+            f"{self.label}: {self.count} rows, {self.count / elapsed:.0f} rows/s",
+            file=self.out
+        )
+
+
+# -----------------------#
+# Batched lookups        #
+# -----------------------#
+def get_users_by_ids(user_ids: Iterable[str]) -> Dict[str, UserInDB]:
+    # one pass over the store for any number of ids
+    # a SQL store would do the same with `SELECT ... WHERE id IN (...)`
+    wanted = set(user_ids)
+    return {str(u.id): u for u in users_db.values() if str(u.id) in wanted}
+
+
+class UserLoader:
+    """Request-scoped batcher for user lookups (DataLoader style).
+
+    Ids are queued with `add()`/`add_many()` while a response is being built
+    and resolved together on the first `get()`/`get_many()` with a single
+    call to `batch_fn`. Each id is fetched at most once per request.
+    """
+
+    def __init__(self, batch_fn: Callable[[List[str]], Dict[str, UserInDB]] = get_users_by_ids):
+        self.batch_fn = batch_fn
+        self._cache: Dict[str, Optional[UserInDB]] = {}
+        self._pending: set = set()
+
+    def add(self, user_id):
+        user_id = str(user_id)
+        if user_id not in self._cache:
+            self._pending.add(user_id)
+
+    def add_many(self, user_ids: Iterable):
+        for user_id in user_ids:
+            self.add(user_id)
+
+    def dispatch(self):
+        if not self._pending:
+            return
+        ids = list(self._pending)
+        self._pending.clear()
+        found = self.batch_fn(ids)
+        for user_id in ids:
+            # cache misses too so unknown ids are not looked up again
+            self._cache[user_id] = found.get(user_id)
+
+    def get(self, user_id) -> Optional[UserInDB]:
+        self.add(user_id)
+        self.dispatch()
+        return self._cache[str(user_id)]
+
+    def get_many(self, user_ids: Iterable) -> List[UserInDB]:
+        # skips ids that no longer exist
+        user_ids = [str(user_id) for user_id in user_ids]
+        self.add_many(user_ids)
+        self.dispatch()
+        return [self._cache[i] for i in user_ids if self._cache[i] is not None]
+
+
+async def get_user_loader() -> UserLoader:
+    # FastAPI dependency: a fresh loader (and cache) per request
+    return UserLoader()
+
+
+# -----------------------#
+# Reading                #
+# -----------------------#
+def read_jsonl_records(path: str) -> Iterator[Tuple[int, dict]]:
+    # (line number, object) for every usable line, bad lines are reported and skipped
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                print(f"{path}:{line_no}: invalid JSON, skipped", file=sys.stderr)
+                continue
+            if not isinstance(record, dict):
+                print(f"{path}:{line_no}: not a JSON object, skipped", file=sys.stderr)
+                continue
+            yield line_no, record
+
+
+def read_user_rows(path: str) -> Iterator[dict]:
+    # stream one row at a time from a .csv or .jsonl file
+    if path.endswith(".csv"):
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                yield {k: v for k, v in row.items() if v not in (None, "")}
+    else:
+        for _, row in read_jsonl_records(path):
+            yield row
+
+
+def batched(rows: Iterable[dict], size: int) -> Iterator[list]:
+    it = iter(rows)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+# -----------------------#
+# Import                 #
+# -----------------------#
+class RowError(ValueError):
+    """A user row that cannot be imported; the message says why."""
+
+
+def check_user_row(row: dict, usernames: set, emails: set, ids: set) -> UserInDB:
+    """Validate a row against the same rules as POST /auth/register.
+
+    Returns the user to store with normalized username/email and its id.
+    Rows with a plain password get an empty hashed_password, filled in
+    once the batch has been hashed. Raises RowError if the row is rejected.
+    """
+    try:
+        base = UserBase(username=row.get("username"), email=row.get("email"))
+    except ValidationError:
+        raise RowError("Invalid username or email")
+    if base.username in usernames:
+        raise RowError("Username already registered")
+    if base.email in emails:
+        raise RowError("Email already exists")
+
+    if row.get("id"):
+        try:
+            parsed_id = uuid.UUID(str(row["id"]))
+        except ValueError:
+            raise RowError("Invalid id")
+        if parsed_id.version != 4:
+            raise RowError("Invalid id")
+        user_id = str(parsed_id)
+        if user_id in ids:
+            raise RowError("User id already exists")
+    else:
+        user_id = str(uuid.uuid4())
+
+    if "hashed_password" in row:
+        if not is_password_hash(row["hashed_password"]):
+            raise RowError("hashed_password is not a valid argon2/bcrypt hash")
+        hashed_pw = row["hashed_password"]
+    elif not isinstance(row.get("password"), str) or not row["password"]:
+        raise RowError("Missing password")
+    else:
+        hashed_pw = ""
+
+    try:
+        return UserInDB(
+            id=user_id,
+            username=base.username,
+            email=base.email,
+            hashed_password=hashed_pw,
+            role=row.get("role", "user"),
+            display_name=row.get("display_name"),
+            bio=row.get("bio"),
+            is_email_verified=row.get("is_email_verified", False),
+            email_verified_at=row.get("email_verified_at"),
+            created_at=row.get("created_at") or datetime.now(timezone.utc)
+        )
+    except ValidationError as e:
+        error = e.errors()[0]
+        field = ".".join(str(part) for part in error["loc"])
+        raise RowError(f"Invalid {field}: {error['msg']}")
+
+
+def import_users(rows: Iterable[dict], batch_size: int = 500, workers: Optional[int] = None) -> dict:
+    """Validate, hash and insert user rows into users_db one batch at a time.
+
+    Rows carrying `hashed_password` are stored as-is, rows carrying a plain
+    `password` are hashed across a process pool (one process per core by default).
+    """
+    workers = workers or os.cpu_count() or 1
+    usernames = set(users_db)
+    emails = {u.email for u in users_db.values()}
+    ids = {str(u.id) for u in users_db.values()}
+    report = {"imported": 0, "skipped": 0}
+    progress = Progress("import")
+    # only started once a batch actually has plain passwords to hash
+    pool = None
+    try:
+        for batch_no, batch in enumerate(batched(rows, batch_size)):
+            accepted = []
+            for i, row in enumerate(batch, start=batch_no * batch_size + 1):
+                try:
+                    user = check_user_row(row, usernames, emails, ids)
+                except RowError as e:
+                    print(f"row {i}: {e}", file=sys.stderr)
+                    report["skipped"] += 1
+                    continue
+                # reserve now so duplicates later in the file are caught
+                usernames.add(user.username)
+                emails.add(user.email)
+                ids.add(str(user.id))
+                accepted.append((row, user))
+
+            to_hash = [(row["password"], user) for row, user in accepted if "hashed_password" not in row]
+            plain = [password for password, _ in to_hash]
+            if plain and workers > 1:
+                if pool is None:
+                    pool = ProcessPoolExecutor(max_workers=workers)
+                chunksize = max(1, len(plain) // (workers * 4))
+                hashed = pool.map(hash_password, plain, chunksize=chunksize)
+            else:
+                hashed = map(hash_password, plain)
+            for (_, user), hashed_pw in zip(to_hash, hashed):
+                user.hashed_password = hashed_pw
+
+            # write the whole batch to the store at once
+            users_db.update((user.username, user) for _, user in accepted)
+            report["imported"] += len(accepted)
+            progress.tick(len(batch))
+    finally:
+        if pool:
+            pool.shutdown()
+    progress.report()
+    return report
+
+
+# -----------------------#
+# Export / snapshots     #
+# -----------------------#
+def export_users(out: TextIO) -> int:
+    """Stream every user, then every follow edge, to `out` as JSONL.
+
+    Records are written one at a time so memory stays flat regardless of
+    the size of the store. Returns the number of lines written.
+    """
+    progress = Progress("export")
+    for user in users_db.values():
+        record = user.model_dump(mode="json", exclude={"followers", "following"})
+        out.write(json.dumps({"type": "user", **record}) + "\n")
+        progress.tick()
+    for user in users_db.values():
+        for following_id in user.following:
+            out.write(json.dumps({
+                "type": "follow",
+                "follower_id": str(user.id),
+                "following_id": str(following_id)
+            }) + "\n")
+            progress.tick()
+    progress.report()
+    return progress.count
+
+
+def load_snapshot(path: str) -> int:
+    # load a file written by export_users back into users_db,
+    # bad records are reported with their line and skipped
+    by_id = {}
+    count = 0
+    for line_no, record in read_jsonl_records(path):
+        kind = record.pop("type", "user")
+        try:
+            if kind == "user":
+                user = UserInDB(**record)
+                users_db[user.username] = user
+                by_id[str(user.id)] = user
+            elif kind == "follow":
+                follower = by_id.get(record["follower_id"])
+                followed = by_id.get(record["following_id"])
+                if follower and followed:
+                    follower.following.add(followed.id)
+                    followed.followers.add(follower.id)
+            else:
+                raise ValueError(f"unknown record type {kind!r}")
+        except ValidationError as e:
+            print(f"{path}:{line_no}: invalid user record ({e.errors()[0]['msg']}), skipped", file=sys.stderr)
+            continue
+        except (KeyError, ValueError) as e:
+            print(f"{path}:{line_no}: invalid record ({e}), skipped", file=sys.stderr)
+            continue
+        count += 1
+    return count
+
+
+def save_snapshot(path: str) -> int:
+    # write to a temp file first so a crash never leaves a half-written snapshot
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        count = export_users(f)
+    os.replace(tmp_path, path)
+    return count
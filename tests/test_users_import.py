@@ -0,0 +1,128 @@
+import io
+import uuid
+import pytest
+from databases.database import users_db
+from services.auth_services import is_password_hash
+from services.users_services import (
+    RowError, check_user_row, import_users, export_users, load_snapshot, save_snapshot
+)
+
+BCRYPT_HASH = "$2b$12$" + "a" * 22 + "b" * 31
+ARGON2_HASH = "$argon2id$v=19$m=65536,t=3,p=4$c2FsdHNhbHQ$aGFzaGhhc2hoYXNo"
+
+
+@pytest.fixture(autouse=True)
+def empty_store():
+    users_db.clear()
+    yield
+    users_db.clear()
+
+
+def row(username, email=None, **fields):
+    return {
+        "username": username,
+        "email": email or f"{username}@example.com",
+        "hashed_password": BCRYPT_HASH,
+        **fields
+    }
+
+
+def test_is_password_hash_accepts_only_well_formed_hashes():
+    assert is_password_hash(BCRYPT_HASH)
+    assert is_password_hash(ARGON2_HASH)
+    assert not is_password_hash(None)
+    assert not is_password_hash("plain-password")
+    assert not is_password_hash("$2b$12$garbage")
+    assert not is_password_hash("$2b$99$" + "a" * 53)
+    assert not is_password_hash("$argon2id$garbage")
+
+
+def test_malformed_hashes_are_rejected():
+    for bad in (None, "$2b$12$garbage", "$argon2id$garbage"):
+        with pytest.raises(RowError):
+            check_user_row(row("bob", hashed_password=bad), set(), set(), set())
+
+
+def test_duplicates_within_one_file(capsys):
+    user_id = str(uuid.uuid4())
+    report = import_users([
+        row("bob", "Bob@EXAMPLE.com", id=user_id),
+        row("bob", "other@example.com"),
+        row("bob2", "Bob@example.com"),
+        row("carol", id=user_id),
+    ], workers=1)
+
+    assert report == {"imported": 1, "skipped": 3}
+    assert users_db["bob"].email == "Bob@example.com"
+    err = capsys.readouterr().err
+    assert "row 2: Username already registered" in err
+    assert "row 3: Email already exists" in err
+    assert "row 4: User id already exists" in err
+
+
+def test_duplicates_against_existing_store():
+    import_users([row("bob")], workers=1)
+    existing_id = str(users_db["bob"].id)
+
+    report = import_users([
+        row("bob", "new@example.com"),
+        row("bob2", "bob@example.com"),
+        row("carol", id=existing_id),
+    ], workers=1)
+
+    assert report == {"imported": 0, "skipped": 3}
+    assert set(users_db) == {"bob"}
+
+
+def test_invalid_row_does_not_reserve_its_username(capsys):
+    report = import_users([
+        row("dave", created_at="bad"),
+        row("dave"),
+    ], workers=1)
+
+    assert report == {"imported": 1, "skipped": 1}
+    assert "dave" in users_db
+    err = capsys.readouterr().err
+    assert err.index("row 1:") < err.index("import:")
+
+
+def test_plain_passwords_are_hashed():
+    import_users([{"username": "erin", "email": "erin@example.com", "password": "s3cret"}], workers=1)
+    assert is_password_hash(users_db["erin"].hashed_password)
+
+
+def test_snapshot_round_trip_keeps_follows(tmp_path):
+    import_users([row("alice"), row("bob"), row("carol")], workers=1)
+    alice, bob, carol = users_db["alice"], users_db["bob"], users_db["carol"]
+    for follower, followed in ((alice, bob), (carol, bob), (bob, alice)):
+        follower.following.add(followed.id)
+        followed.followers.add(follower.id)
+
+    path = str(tmp_path / "snapshot.jsonl")
+    save_snapshot(path)
+    users_db.clear()
+    assert load_snapshot(path) == 6
+
+    assert users_db["bob"].followers == {alice.id, carol.id}
+    assert users_db["alice"].following == {bob.id}
+    assert users_db["alice"].followers == {bob.id}
+    assert users_db["carol"].followers == set()
+
+
+def test_load_snapshot_skips_bad_records(tmp_path, capsys):
+    import_users([row("alice")], workers=1)
+    out = io.StringIO()
+    export_users(out)
+    path = tmp_path / "snapshot.jsonl"
+    path.write_text(
+        out.getvalue()
+        + '{"type": "user", "username": "broken"}\n'
+        + '{"type": "follow", "follower_id": "x"}\n'
+        + "not json\n"
+    )
+    users_db.clear()
+
+    assert load_snapshot(str(path)) == 1
+    assert set(users_db) == {"alice"}
+    err = capsys.readouterr().err
+    assert f"{path}:2:" in err and f"{path}:3:" in err and f"{path}:4:" in err
@@ -0,0 +1,62 @@
+import uuid
+from datetime import datetime, timezone
+from databases.database import users_db
+from schemas.auth_schema import UserInDB
+from services.users_services import UserLoader, get_users_by_ids
+
+
+class RecordingBatch:
+    """Fake store lookup that records every call it receives."""
+
+    def __init__(self, users):
+        self.users = users
+        self.calls = []
+
+    def __call__(self, ids):
+        self.calls.append(sorted(ids))
+        return {i: self.users[i] for i in ids if i in self.users}
+
+
+def test_repeated_ids_are_fetched_once():
+    batch = RecordingBatch({"a": "user-a", "b": "user-b"})
+    loader = UserLoader(batch_fn=batch)
+
+    assert loader.get_many(["a", "b", "a"]) == ["user-a", "user-b", "user-a"]
+    assert batch.calls == [["a", "b"]]
+
+
+def test_queued_ids_resolve_in_one_call():
+    batch = RecordingBatch({"a": "user-a", "b": "user-b"})
+    loader = UserLoader(batch_fn=batch)
+
+    loader.add("a")
+    loader.add_many(["b", "a"])
+    assert loader.get("a") == "user-a"
+    assert loader.get("b") == "user-b"
+    assert batch.calls == [["a", "b"]]
+
+
+def test_misses_are_cached_and_skipped():
+    batch = RecordingBatch({"a": "user-a"})
+    loader = UserLoader(batch_fn=batch)
+
+    assert loader.get("missing") is None
+    assert loader.get_many(["a", "missing"]) == ["user-a"]
+    assert batch.calls == [["missing"], ["a"]]
+
+
+def test_default_batch_fn_reads_users_db():
+    user = UserInDB(
+        id=str(uuid.uuid4()),
+        username="loader_test",
+        email="loader_test@example.com",
+        hashed_password="x",
+        role="user",
+        created_at=datetime.now(timezone.utc)
+    )
+    users_db[user.username] = user
+    try:
+        assert get_users_by_ids([str(user.id), str(uuid.uuid4())]) == {str(user.id): user}
+        assert UserLoader().get(user.id) is user
+    finally:
+        del users_db[user.username]